@@ -34,9 +34,7 @@
 #     else:
 #         print("No repositories found or an error occurred.")
 
-from src.github_api import GitHubAPIClient
-from src.data_processing import DataProcessor
-from src.cli import main
-
 if __name__ == "__main__":
+    # Imported here so that importing this module stays free of pandas/matplotlib/network client setup
+    from src.cli import main
     main()
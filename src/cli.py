@@ -1,43 +1,67 @@
-import sys
+import asyncio
 from typing import Optional, List, Dict, Set, Any
-from rich.console import Console
-import argparse
-import pandas as pd
-import json
 import traceback
 import re
 
-from .github_api import GitHubAPIClient
-from .llm_client import LLMClient
-from .data_processing import DataProcessor
-from .visualization import Visualizer
+# Query matchers for pattern-based intent detection, compiled once at import
+_REPO_TERM_RE = re.compile(r'\brepo(?:s|sitory|sitories)?\b', re.I)
+_ACTION_RE = re.compile(r'\b(?:list|show|get|find|display|tell)\b', re.I)
+_SEARCH_RE = re.compile(r'\b(?:search|find)\b', re.I)
+_OF_USERNAME_RE = re.compile(r'\bof\s+([A-Za-z0-9_-]+)', re.I)
+_SEARCH_NOISE_RE = re.compile(r'\b(?:search|find|repos?|repositor(?:y|ies))\b', re.I)
 
 class GitXRCLI:
     """Command-line interface for the GITxR agent."""
     
+    # Dictionary mapping intents to their required parameters with description
+    _INTENT_PARAMS = {
+        'get_contributors': {'owner': 'repository owner/organization', 'repo': 'repository name'},
+        'get_commit_history': {'owner': 'repository owner/organization', 'repo': 'repository name'},
+        'get_recent_merged_prs': {'owner': 'repository owner/organization', 'repo': 'repository name'},
+        'list_user_repositories': {'username': 'GitHub username'},
+        'get_user_repositories': {'username': 'GitHub username'},
+        'get_repositories': {'username': 'GitHub username'},  # Added this to handle "get repositories" intent
+        'search_repositories': {'query': 'search term'},
+        'unknown': {},  # Handle unknown intent gracefully
+    }
+    
+    # Map similar intents to canonical handlers
+    _INTENT_ALIASES = {
+        'get_repositories': 'list_user_repositories',
+        'get_repos': 'list_user_repositories',
+        'get_user_repositories': 'list_user_repositories',
+    }
+    
     def __init__(self):
+        # Heavy dependencies (rich, pandas, matplotlib, HTTP/LLM clients) are imported on first use,
+        # so `--help` and argument errors return without paying their import time
+        from rich.console import Console
+        from .github_api import GitHubAPIClient
+        from .llm_client import LLMClient
+        from .data_processing import DataProcessor
+        from .visualization import Visualizer
+        
         self.console = Console()
         self.github_client = GitHubAPIClient()
         self.llm_client = LLMClient()
         self.data_processor = DataProcessor()
         self.visualizer = Visualizer()
         self.conversation_history = []
+        # Repositories fetched speculatively while the user was typing a username, keyed by lowercased username
+        self._prefetched_repos: Dict[str, List[Dict]] = {}
+        # Intent dispatch table, resolved with one dict lookup per query
+        self._handlers = {
+            'get_contributors': self._handle_contributors,
+            'get_commit_history': self._handle_commit_history,
+            'get_recent_merged_prs': self._handle_recent_merged_prs,
+            'list_user_repositories': self._handle_user_repositories,
+            'search_repositories': self._handle_search_repositories,
+            'unknown': self._handle_unknown,
+        }
         
     def get_required_params(self, intent: str) -> Dict[str, str]:
         """Get required parameters for a specific intent."""
-        # Dictionary mapping intents to their required parameters with description
-        intent_params = {
-            'get_contributors': {'owner': 'repository owner/organization', 'repo': 'repository name'},
-            'get_commit_history': {'owner': 'repository owner/organization', 'repo': 'repository name'},
-            'get_recent_merged_prs': {'owner': 'repository owner/organization', 'repo': 'repository name'},
-            'list_user_repositories': {'username': 'GitHub username'},
-            'get_user_repositories': {'username': 'GitHub username'},
-            'get_repositories': {'username': 'GitHub username'},  # Added this to handle "get repositories" intent
-            'search_repositories': {'query': 'search term'},
-            'unknown': {},  # Handle unknown intent gracefully
-        }
-        
-        return intent_params.get(intent, {})
+        return self._INTENT_PARAMS.get(intent, {})
     
     def extract_username_from_input(self, input_text: str) -> str:
         """Extract just the username from user input that might contain a full query."""
@@ -57,22 +81,33 @@ class GitXRCLI:
             
         return input_text  # Return original if no pattern matched
     
-    def validate_and_complete_params(self, intent: str, params: Any) -> Dict:
+    def validate_and_complete_params(self, intent: str, params: Dict) -> Dict:
         """Check if all required parameters are present and prompt for missing ones."""
         required_params = self.get_required_params(intent)
         
-        # Convert params to dictionary if it's not already (handles lists or other unexpected types)
-        if not isinstance(params, dict):
-            self.console.print(f"[bold yellow]Warning:[/bold yellow] Expected parameters as dictionary but got {type(params)}. Converting to empty dict.")
-            updated_params = {}
-        else:
-            updated_params = params.copy()
+        # Check for missing required parameters; complete parameters are returned as-is without a copy
+        missing_params = {name: desc for name, desc in required_params.items() if not params.get(name)}
+        if not missing_params:
+            return params
+        
+        return asyncio.run(self._prompt_missing_params(dict(params), missing_params))
+    
+    async def _prompt_missing_params(self, updated_params: Dict, missing_params: Dict[str, str]) -> Dict:
+        """Prompt for missing parameters without blocking the event loop.
+        
+        When a username is needed and one is configured, that user's repositories are
+        fetched in the background while the prompt waits, and kept if the answer matches.
+        """
+        from prompt_toolkit import PromptSession
+        
+        prompt_session = PromptSession()
+        guess = self.github_client.username if 'username' in missing_params else None
+        prefetch = asyncio.create_task(self.github_client.get_user_repositories_async(guess)) if guess else None
         
-        # Check for missing required parameters
-        for param_name, param_desc in required_params.items():
-            if param_name not in updated_params or not updated_params.get(param_name):
+        try:
+            for param_name, param_desc in missing_params.items():
                 self.console.print(f"[bold yellow]Missing required parameter:[/bold yellow] {param_desc}")
-                param_value = self.console.input(f"Please provide the {param_name} ({param_desc}): ")
+                param_value = await prompt_session.prompt_async(f"Please provide the {param_name} ({param_desc}): ")
                 
                 # Special handling for usernames
                 if param_name == 'username':
@@ -90,6 +125,16 @@ class GitXRCLI:
                     "role": "user", 
                     "content": param_value
                 })
+        finally:
+            if prefetch:
+                if str(updated_params.get('username', '')).lower() == guess.lower():
+                    try:
+                        self._prefetched_repos[guess.lower()] = await prefetch
+                    except Exception:
+                        pass  # The regular fetch will retry and report the error
+                else:
+                    # Aborts the in-flight request, so a wrong guess does not hold up the prompt flow
+                    prefetch.cancel()
         
         return updated_params
     
@@ -104,15 +149,9 @@ class GitXRCLI:
                 self.console.print("[blue]Using direct pattern matching for repository listing query[/blue]")
             else:
                 # Use LLM to understand the query intent and extract parameters
+                # Replies that parse but are not shaped like an intent raise too, and fall back the same way
                 try:
                     intent_data = self.llm_client.process_query(query, self.conversation_history)
-                    
-                    # Ensure intent_data is a dictionary
-                    if not isinstance(intent_data, dict):
-                        self.console.print(f"[bold yellow]Warning:[/bold yellow] LLM returned non-dictionary: {intent_data}")
-                        # Fallback to pattern matching
-                        intent_data = self.fallback_intent_detection(query)
-                        self.console.print("[blue]Using fallback pattern matching for intent detection[/blue]")
                 except Exception as e:
                     self.console.print(f"[bold yellow]LLM processing failed: {str(e)}[/bold yellow]")
                     # Fallback to pattern matching
@@ -142,9 +181,14 @@ class GitXRCLI:
             # Generate a response based on the data and original query
             if result:
                 try:
-                    response = self.llm_client.generate_response(result, query)
-                    self.console.print(f"[bold green]Response:[/bold green] {response}")
-                    self.conversation_history.append({"role": "assistant", "content": response})
+                    # Print the response as it streams in rather than after the whole completion
+                    self.console.print("[bold green]Response:[/bold green] ", end="")
+                    chunks = []
+                    for chunk in self.llm_client.generate_response_stream(result, query):
+                        chunks.append(chunk)
+                        self.console.print(chunk, end="", markup=False, highlight=False, soft_wrap=True)
+                    self.console.print()
+                    self.conversation_history.append({"role": "assistant", "content": "".join(chunks)})
                 except Exception as e:
                     self.console.print(f"[bold yellow]Could not generate response: {str(e)}[/bold yellow]")
                     self.console.print("[green]Data was processed successfully but couldn't generate a narrative response.[/green]")
@@ -155,33 +199,17 @@ class GitXRCLI:
     
     def is_list_repos_query(self, query: str) -> bool:
         """Check if query is asking for repository listing."""
-        query = query.lower()
-        repo_terms = ["repo", "repos", "repositories", "repository"]
-        action_terms = ["list", "show", "get", "find", "display", "tell"]
-        
-        # Check if query contains both repo terms and action terms
-        has_repo_term = any(term in query for term in repo_terms)
-        has_action_term = any(term in query for term in action_terms)
-        
-        # Check if the query mentions "of username" pattern
-        has_of_pattern = "of " in query
-        
-        return (has_repo_term and has_action_term) or (has_repo_term and has_of_pattern)
+        # A repo term plus either an action verb or an "of username" pattern
+        return bool(_REPO_TERM_RE.search(query)) and bool(_ACTION_RE.search(query) or _OF_USERNAME_RE.search(query))
     
     def fallback_intent_detection(self, query: str) -> Dict:
         """Fallback method to detect intent when LLM fails."""
-        query = query.lower()
-        
         # Extract username if present in query
-        username = None
-        if "of " in query:
-            # Try to extract username after "of"
-            parts = query.split("of ", 1)
-            if len(parts) > 1:
-                username = parts[1].strip()
+        match = _OF_USERNAME_RE.search(query)
+        username = match.group(1) if match else None
         
-        repo_terms = ["repo", "repos", "repositories", "repository"]
-        if any(x in query for x in ["list", "show", "get", "find", "display", "tell"]) and any(x in query for x in repo_terms):
+        has_repo_term = bool(_REPO_TERM_RE.search(query))
+        if has_repo_term and _ACTION_RE.search(query):
             if username:
                 return {
                     "intent": "list_user_repositories",
@@ -193,10 +221,10 @@ class GitXRCLI:
                     "parameters": {}
                 }
                 
-        elif any(x in query for x in ["search", "find"]) and any(x in query for x in repo_terms):
+        elif has_repo_term and _SEARCH_RE.search(query):
             return {
                 "intent": "search_repositories",
-                "parameters": {"query": query.replace("search", "").replace("find", "").replace("repos", "").replace("repositories", "").strip()}
+                "parameters": {"query": " ".join(_SEARCH_NOISE_RE.sub("", query).split())}
             }
         
         # Default intent
@@ -209,90 +237,88 @@ class GitXRCLI:
         """Execute the appropriate action based on the intent."""
         intent = intent_data.get('intent')
         params = intent_data.get('parameters', {})
+        intent = self._INTENT_ALIASES.get(intent, intent)
         
-        # Map similar intents to canonical handlers
-        if intent in ['get_repositories', 'get_repos']:
-            intent = 'list_user_repositories'
+        handler = self._handlers.get(intent)
+        if handler is None:
+            self.console.print(f"[bold yellow]Unhandled intent:[/bold yellow] {intent}")
+            return {"error": f"Unhandled intent: {intent}"}
         
         try:
-            if intent == 'get_contributors':
-                data = self.github_client.get_repository_contributors(params.get('owner'), params.get('repo'))
-                df = self.data_processor.contributors_to_dataframe(data)
-                self.visualizer.show_console_table(df, f"Contributors for {params.get('owner')}/{params.get('repo')}")
-                return {"contributors": data}
-            
-            elif intent == 'get_commit_history':
-                branch = params.get('branch', 'main')
-                count = int(params.get('count', 10))
-                data = self.github_client.get_commit_history(params.get('owner'), params.get('repo'), branch, count)
-                df = self.data_processor.commits_to_dataframe(data)
-                self.visualizer.show_console_table(df, f"Commit history for {params.get('owner')}/{params.get('repo')}")
-                return {"commits": data}
-            
-            elif intent == 'get_recent_merged_prs':
-                count = int(params.get('count', 10))
-                data = self.github_client.get_recent_merged_prs(params.get('owner'), params.get('repo'), count)
-                df = self.data_processor.pull_requests_to_dataframe(data)
-                self.visualizer.show_console_table(df, f"Recent merged PRs for {params.get('owner')}/{params.get('repo')}")
-                return {"pull_requests": data}
-                
-            elif intent == 'list_user_repositories' or intent == 'get_user_repositories':
-                username = params.get('username')
-                if not username:
-                    self.console.print("[bold red]Error: No username provided for repository listing[/bold red]")
-                    return {"error": "No username provided"}
-                
-                self.console.print(f"[blue]Fetching repositories for user: {username}[/blue]")
-                try:
-                    data = self.github_client.get_user_repositories(username)
-                    if not data:
-                        self.console.print(f"[yellow]No repositories found for user: {username}[/yellow]")
-                        return {"repositories": [], "message": f"No repositories found for {username}"}
-                    
-                    if isinstance(data, list):
-                        # Create a simplified format for display
-                        repos_data = []
-                        for repo in data:
-                            repos_data.append({
-                                'Name': repo['name'],
-                                'Description': repo.get('description', 'No description'),
-                                'Stars': repo['stargazers_count'],
-                                'Forks': repo['forks_count'],
-                                'Last Updated': repo['updated_at'],
-                                'URL': repo['html_url']
-                            })
-                        df = pd.DataFrame(repos_data)
-                        self.visualizer.show_console_table(df, f"Repositories for user '{username}'")
-                        return {"repositories": data}
-                    else:
-                        self.console.print(f"[bold yellow]Warning:[/bold yellow] Unexpected data format: {type(data)}")
-                        return {"error": f"Unexpected data format: {type(data)}"}
-                except Exception as e:
-                    self.console.print(f"[bold red]Error fetching repositories:[/bold red] {str(e)}")
-                    return {"error": str(e)}
-            
-            elif intent == 'search_repositories':
-                data = self.github_client.search_repositories(params.get('query'), params.get('sort', 'stars'))
-                # Fix: Check if data is a dict (API response) or list (items directly)
-                items = data.get('items', []) if isinstance(data, dict) else data
-                df = self.data_processor.search_results_to_dataframe(items, 'repositories')
-                self.visualizer.show_console_table(df, f"Repository search results for '{params.get('query')}'")
-                return {"search_results": data}
-            
-            elif intent == 'unknown':
-                self.console.print("[bold yellow]Could not determine specific intent. Please try rephrasing your query.[/bold yellow]")
-                return {"error": "Unknown intent", "query": intent_data.get('query', '')}
-                
-            else:
-                self.console.print(f"[bold yellow]Unhandled intent:[/bold yellow] {intent}")
-                return {"error": f"Unhandled intent: {intent}"}
-                
+            return handler(params)
         except Exception as e:
             self.console.print(f"[bold red]Error executing intent:[/bold red] {str(e)}")
             traceback.print_exc()  # Print the full stack trace for debugging
             return {"error": str(e)}
+    
+    def _handle_contributors(self, params: Dict) -> Dict:
+        """Show contributors for a repository."""
+        data = self.github_client.get_repository_contributors(params.get('owner'), params.get('repo'))
+        df = self.data_processor.contributors_to_dataframe(data)
+        self.visualizer.show_console_table(df, f"Contributors for {params.get('owner')}/{params.get('repo')}")
+        return {"contributors": data}
+    
+    def _handle_commit_history(self, params: Dict) -> Dict:
+        """Show recent commit history for a repository."""
+        branch = params.get('branch', 'main')
+        count = int(params.get('count', 10))
+        data = self.github_client.get_commit_history(params.get('owner'), params.get('repo'), branch, count)
+        df = self.data_processor.commits_to_dataframe(data)
+        self.visualizer.show_console_table(df, f"Commit history for {params.get('owner')}/{params.get('repo')}")
+        return {"commits": data}
+    
+    def _handle_recent_merged_prs(self, params: Dict) -> Dict:
+        """Show recently merged pull requests for a repository."""
+        count = int(params.get('count', 10))
+        data = self.github_client.get_recent_merged_prs(params.get('owner'), params.get('repo'), count)
+        df = self.data_processor.pull_requests_to_dataframe(data)
+        self.visualizer.show_console_table(df, f"Recent merged PRs for {params.get('owner')}/{params.get('repo')}")
+        return {"pull_requests": data}
+    
+    def _handle_user_repositories(self, params: Dict) -> Dict:
+        """Show repositories owned by a user."""
+        username = params.get('username')
+        if not username:
+            self.console.print("[bold red]Error: No username provided for repository listing[/bold red]")
+            return {"error": "No username provided"}
+        
+        self.console.print(f"[blue]Fetching repositories for user: {username}[/blue]")
+        try:
+            prefetched = self._prefetched_repos.pop(username.lower(), None)
+            data = prefetched if prefetched is not None else self.github_client.get_user_repositories(username)
+            if not data:
+                self.console.print(f"[yellow]No repositories found for user: {username}[/yellow]")
+                return {"repositories": [], "message": f"No repositories found for {username}"}
+            
+            if isinstance(data, list):
+                # Create a simplified format for display
+                df = self.data_processor.repositories_to_dataframe(data)
+                self.visualizer.show_console_table(df, f"Repositories for user '{username}'")
+                return {"repositories": data}
+            else:
+                self.console.print(f"[bold yellow]Warning:[/bold yellow] Unexpected data format: {type(data)}")
+                return {"error": f"Unexpected data format: {type(data)}"}
+        except Exception as e:
+            self.console.print(f"[bold red]Error fetching repositories:[/bold red] {str(e)}")
+            return {"error": str(e)}
+    
+    def _handle_search_repositories(self, params: Dict) -> Dict:
+        """Search repositories across GitHub."""
+        data = self.github_client.search_repositories(params.get('query'), params.get('sort', 'stars'))
+        # Fix: Check if data is a dict (API response) or list (items directly)
+        items = data.get('items', []) if isinstance(data, dict) else data
+        df = self.data_processor.search_results_to_dataframe(items, 'repositories')
+        self.visualizer.show_console_table(df, f"Repository search results for '{params.get('query')}'")
+        return {"search_results": data}
+    
+    def _handle_unknown(self, params: Dict) -> Dict:
+        """Report that the query could not be mapped to an intent."""
+        self.console.print("[bold yellow]Could not determine specific intent. Please try rephrasing your query.[/bold yellow]")
+        return {"error": "Unknown intent", "query": params.get('query', '')}
 
 def main():
+    import argparse
+    
     parser = argparse.ArgumentParser(description="GITxR Agent - GitHub Explainer CLI")
     parser.add_argument("query", nargs="*", help="Natural language query about GitHub repositories")
     
@@ -304,7 +330,7 @@ def main():
         cli.process_query(" ".join(args.query))
     else:
         # Interactive mode
-        console = Console()
+        console = cli.console
         console.print("[bold green]GITxR Agent[/bold green] - Ask me anything about GitHub repositories!")
         console.print("Type 'exit' or 'quit' to exit.")
         
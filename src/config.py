@@ -1,8 +1,16 @@
 import os
-from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
+# Load environment variables from a .env file, importing python-dotenv only when one exists
+_ENV_FILE = next(
+    (path for path in (
+        os.path.join(os.getcwd(), ".env"),
+        os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".env"),
+    ) if os.path.isfile(path)),
+    None
+)
+if _ENV_FILE:
+    from dotenv import load_dotenv
+    load_dotenv(_ENV_FILE)
 
 # GitHub API credentials
 GITHUB_TOKEN = os.getenv("GITHUB_TOKEN")
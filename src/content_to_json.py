@@ -1,30 +1,23 @@
-import json
+import orjson
 
 def convert_to_json(input_data):
     """
-    Convert data to JSON format and print it to console.
+    Convert data to JSON format.
     
     Args:
-        input_data: String to be parsed as JSON or a Python object to be converted to JSON
+        input_data: str/bytes to be parsed as JSON or an already parsed dict/list
         
     Returns:
         dict/list/None: The parsed JSON data if successful, None if parsing fails
     """
-    try:
-        # Check if input is already a dict or list (already parsed)
-        if isinstance(input_data, (dict, list)):
-            json_data = input_data
-        else:
-            # Try to parse the string as JSON
-            json_data = json.loads(input_data)
-        
-        # Print the formatted JSON to console
-        print("Converted JSON:")
-        # print(json.dumps(json_data, indent=2))
-        
-        return json_data
+    # Already parsed data is passed through untouched
+    if isinstance(input_data, (dict, list)):
+        return input_data
     
-    except (json.JSONDecodeError, TypeError) as e:
+    try:
+        # orjson parses str, bytes and bytearray directly without an intermediate decode
+        return orjson.loads(input_data)
+    except (orjson.JSONDecodeError, TypeError) as e:
         print(f"Error: Invalid JSON input - {e}")
         return None
 
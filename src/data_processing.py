@@ -1,11 +1,17 @@
 import pandas as pd
-from typing import Dict, List, Any, Optional
+import pyarrow as pa
+import pyarrow.csv as pacsv
+from itertools import islice
+from typing import Dict, Iterable, List, Any, Optional, Sequence
 import json
 import os
 
 class DataProcessor:
     """Process and transform GitHub API data."""
     
+    # Records flattened at a time when building a DataFrame from a streamed iterator
+    STREAM_CHUNK_SIZE = 1000
+    
     @staticmethod
     def contributors_to_dataframe(contributors: List[Dict]) -> pd.DataFrame:
         """Convert contributors data to a pandas DataFrame."""
@@ -14,81 +20,117 @@ class DataProcessor:
             df = df[['login', 'contributions', 'html_url']].rename(
                 columns={'login': 'Username', 'contributions': 'Contributions', 'html_url': 'Profile URL'}
             )
-        return df
+        return DataProcessor._optimize_dtypes(df, strings=['Username', 'Profile URL'])
+    
+    @staticmethod
+    def _optimize_dtypes(df: pd.DataFrame, categorical: Sequence[str] = (), strings: Sequence[str] = ()) -> pd.DataFrame:
+        """Store low-cardinality columns as categories and free-text columns as Arrow-backed strings."""
+        dtypes = {col: 'category' for col in categorical}
+        dtypes.update({col: 'string[pyarrow]' for col in strings})
+        return df.astype({col: dtype for col, dtype in dtypes.items() if col in df.columns})
+    
+    @staticmethod
+    def _flatten(records: Iterable[Dict], fields: List[str]) -> pd.DataFrame:
+        """Project the given dotted field paths out of nested JSON records into a DataFrame.
+        
+        Only the requested paths are walked, one column at a time, so the rest of each
+        (often deeply nested) record is never flattened. Non-list iterables (e.g. records
+        streamed from the API) are flattened in bounded chunks, so only the projected
+        columns are kept in memory rather than every full record.
+        """
+        if not isinstance(records, list):
+            iterator = iter(records)
+            frames = []
+            while True:
+                chunk = list(islice(iterator, DataProcessor.STREAM_CHUNK_SIZE))
+                if not chunk:
+                    break
+                frames.append(DataProcessor._flatten(chunk, fields))
+            return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=fields)
+        if not records:
+            return pd.DataFrame(columns=fields)
+        columns = {}
+        for field in fields:
+            keys = field.split('.')
+            column = [record.get(keys[0]) for record in records]
+            # Descend one level at a time; a missing or null parent yields None
+            for key in keys[1:]:
+                column = [value.get(key) if isinstance(value, dict) else None for value in column]
+            columns[field] = column
+        return pd.DataFrame(columns, columns=fields)
     
     @staticmethod
-    def commits_to_dataframe(commits: List[Dict]) -> pd.DataFrame:
+    def commits_to_dataframe(commits: Iterable[Dict]) -> pd.DataFrame:
         """Convert commit history data to a pandas DataFrame."""
-        data = []
-        for commit in commits:
-            data.append({
-                'SHA': commit['sha'][:7],
-                'Author': commit['commit']['author']['name'],
-                'Date': commit['commit']['author']['date'],
-                'Message': commit['commit']['message'].split('\n')[0],
-                'URL': commit.get('html_url', '')
-            })
-        return pd.DataFrame(data)
+        df = DataProcessor._flatten(commits, ['sha', 'commit.author.name', 'commit.author.date', 'commit.message', 'html_url'])
+        df['sha'] = df['sha'].str[:7]
+        df['commit.message'] = df['commit.message'].str.split('\n', n=1).str[0]
+        df['html_url'] = df['html_url'].fillna('')
+        df = df.rename(columns={
+            'sha': 'SHA', 'commit.author.name': 'Author', 'commit.author.date': 'Date',
+            'commit.message': 'Message', 'html_url': 'URL'
+        })
+        return DataProcessor._optimize_dtypes(df, categorical=['Author'], strings=['SHA', 'Date', 'Message', 'URL'])
     
     @staticmethod
-    def pull_requests_to_dataframe(prs: List[Dict]) -> pd.DataFrame:
+    def pull_requests_to_dataframe(prs: Iterable[Dict]) -> pd.DataFrame:
         """Convert pull requests data to a pandas DataFrame."""
-        data = []
-        for pr in prs:
-            data.append({
-                'Number': pr['number'],
-                'Title': pr['title'],
-                'Author': pr['user']['login'],
-                'Merged By': pr.get('merged_by', {}).get('login', 'N/A') if pr.get('merged_at') else 'N/A',
-                'Created At': pr['created_at'],
-                'Merged At': pr.get('merged_at', 'N/A'),
-                'URL': pr['html_url']
-            })
-        return pd.DataFrame(data)
+        df = DataProcessor._flatten(prs, ['number', 'title', 'user.login', 'merged_by.login', 'created_at', 'merged_at', 'html_url'])
+        df['merged_by.login'] = df['merged_by.login'].where(df['merged_at'].notna()).fillna('N/A')
+        df['merged_at'] = df['merged_at'].fillna('N/A')
+        df = df.rename(columns={
+            'number': 'Number', 'title': 'Title', 'user.login': 'Author', 'merged_by.login': 'Merged By',
+            'created_at': 'Created At', 'merged_at': 'Merged At', 'html_url': 'URL'
+        })
+        return DataProcessor._optimize_dtypes(
+            df, categorical=['Author', 'Merged By'], strings=['Title', 'Created At', 'Merged At', 'URL']
+        )
     
     @staticmethod
-    def issues_to_dataframe(issues: List[Dict]) -> pd.DataFrame:
+    def issues_to_dataframe(issues: Iterable[Dict]) -> pd.DataFrame:
         """Convert issues data to a pandas DataFrame."""
-        data = []
-        for issue in issues:
-            data.append({
-                'Number': issue['number'],
-                'Title': issue['title'],
-                'State': issue['state'],
-                'Author': issue['user']['login'],
-                'Created At': issue['created_at'],
-                'URL': issue['html_url']
-            })
-        return pd.DataFrame(data)
+        df = DataProcessor._flatten(issues, ['number', 'title', 'state', 'user.login', 'created_at', 'html_url'])
+        df = df.rename(columns={
+            'number': 'Number', 'title': 'Title', 'state': 'State', 'user.login': 'Author',
+            'created_at': 'Created At', 'html_url': 'URL'
+        })
+        return DataProcessor._optimize_dtypes(df, categorical=['State', 'Author'], strings=['Title', 'Created At', 'URL'])
+    
+    @staticmethod
+    def repositories_to_dataframe(repos: Iterable[Dict]) -> pd.DataFrame:
+        """Convert a user's repository listing to a pandas DataFrame."""
+        df = DataProcessor._flatten(repos, ['name', 'description', 'stargazers_count', 'forks_count', 'updated_at', 'html_url'])
+        df['description'] = df['description'].fillna('No description')
+        df = df.rename(columns={
+            'name': 'Name', 'description': 'Description', 'stargazers_count': 'Stars',
+            'forks_count': 'Forks', 'updated_at': 'Last Updated', 'html_url': 'URL'
+        })
+        return DataProcessor._optimize_dtypes(df, strings=['Name', 'Description', 'Last Updated', 'URL'])
     
     @staticmethod
     def search_results_to_dataframe(results: List[Dict], search_type: str) -> pd.DataFrame:
         """Convert search results to a pandas DataFrame."""
         if search_type == 'repositories':
-            data = []
-            for repo in results:
-                data.append({
-                    'Name': repo['name'],
-                    'Owner': repo['owner']['login'],
-                    'Stars': repo['stargazers_count'],
-                    'Forks': repo['forks_count'],
-                    'Language': repo.get('language', 'N/A'),
-                    'Description': repo.get('description', 'N/A'),
-                    'URL': repo['html_url']
-                })
-            return pd.DataFrame(data)
+            df = DataProcessor._flatten(results, ['name', 'owner.login', 'stargazers_count', 'forks_count', 'language', 'description', 'html_url'])
+            df[['language', 'description']] = df[['language', 'description']].fillna('N/A')
+            df = df.rename(columns={
+                'name': 'Name', 'owner.login': 'Owner', 'stargazers_count': 'Stars', 'forks_count': 'Forks',
+                'language': 'Language', 'description': 'Description', 'html_url': 'URL'
+            })
+            return DataProcessor._optimize_dtypes(
+                df, categorical=['Owner', 'Language'], strings=['Name', 'Description', 'URL']
+            )
         elif search_type == 'issues':
-            data = []
-            for issue in results:
-                data.append({
-                    'Title': issue['title'],
-                    'Repository': issue['repository_url'].split('/')[-2] + '/' + issue['repository_url'].split('/')[-1],
-                    'State': issue['state'],
-                    'Author': issue['user']['login'],
-                    'Created At': issue['created_at'],
-                    'URL': issue['html_url']
-                })
-            return pd.DataFrame(data)
+            df = DataProcessor._flatten(results, ['title', 'repository_url', 'state', 'user.login', 'created_at', 'html_url'])
+            # ".../repos/{owner}/{repo}" -> "{owner}/{repo}" in one pass over the column
+            df['repository_url'] = df['repository_url'].str.rsplit('/', n=2).str[-2:].str.join('/')
+            df = df.rename(columns={
+                'title': 'Title', 'repository_url': 'Repository', 'state': 'State', 'user.login': 'Author',
+                'created_at': 'Created At', 'html_url': 'URL'
+            })
+            return DataProcessor._optimize_dtypes(
+                df, categorical=['Repository', 'State', 'Author'], strings=['Title', 'Created At', 'URL']
+            )
         else:
             return pd.DataFrame()
     
@@ -101,7 +143,7 @@ class DataProcessor:
         # Generate file path
         filepath = os.path.join('exports', f"{filename}.csv")
         
-        # Export to CSV
-        df.to_csv(filepath, index=False)
+        # Export to CSV through Arrow's columnar C++ writer
+        pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), filepath)
         
         return filepath
\ No newline at end of file
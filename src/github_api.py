@@ -1,14 +1,53 @@
+import math
+import time
+import httpx
+import ijson
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
 import subprocess
-from typing import Dict, List, Optional, Any, Tuple
-import pandas as pd
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs, urlparse
+from typing import Dict, Iterator, List, Optional, Any, Tuple
 
 from .config import GITHUB_TOKEN, GITHUB_USERNAME, GITHUB_SSH_KEY_PATH
 
+# Largest page size accepted by GitHub's list endpoints
+MAX_PER_PAGE = 100
+
+# Recently merged pull requests with author and merger in a single GraphQL round trip
+MERGED_PRS_QUERY = """
+query($owner: String!, $repo: String!, $count: Int!) {
+  repository(owner: $owner, name: $repo) {
+    pullRequests(states: MERGED, orderBy: {field: UPDATED_AT, direction: DESC}, first: $count) {
+      nodes { number title url createdAt mergedAt author { login } mergedBy { login } }
+    }
+  }
+}
+"""
+
+def _last_page(links: Dict) -> Optional[int]:
+    """Page number of the `Link: rel="last"` relation of a paginated response, if any."""
+    last = links.get("last", {}).get("url")
+    return int(parse_qs(urlparse(last).query)["page"][0]) if last else None
+
 class GitHubAPIClient:
     """Client for interacting with GitHub API and local repositories."""
     
+    # Maximum number of (endpoint, params) responses kept for conditional requests
+    ETAG_CACHE_SIZE = 512
+    # Upper bound on in-flight requests (and fan-out worker threads), to stay under GitHub's secondary rate limits
+    MAX_CONCURRENCY = 5
+    # Times a request rejected by a rate limit is retried after backing off
+    MAX_RATE_LIMIT_RETRIES = 5
+    # Longest wait (seconds) for a rate limit to reset; beyond this the error is reported instead
+    MAX_RATE_LIMIT_WAIT = 60
+    
     def __init__(self, token: str = GITHUB_TOKEN, username: str = GITHUB_USERNAME):
         self.token = token
         self.username = username
@@ -17,12 +56,142 @@ class GitHubAPIClient:
             "Authorization": f"token {self.token}",
             "Accept": "application/vnd.github.v3+json"
         }
+        
+        # Reuse one keep-alive connection pool across calls instead of a new TCP+TLS handshake per request
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(total=5, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504])
+        )
+        self.session.mount("https://", adapter)
+        
+        # (endpoint, params) -> (etag, raw body); 304 responses are free against the rate limit
+        self._etag_cache: OrderedDict = OrderedDict()
+        self._etag_lock = threading.Lock()
+        # Shared by every thread, so concurrent callers and fan-outs together respect MAX_CONCURRENCY
+        self._sem = threading.BoundedSemaphore(self.MAX_CONCURRENCY)
+    
+    def __enter__(self) -> "GitHubAPIClient":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """Close the underlying HTTP session."""
+        self.session.close()
+    
+    @staticmethod
+    def _rate_limit_delay(response: requests.Response, attempt: int) -> Optional[float]:
+        """Seconds to wait before retrying a rate-limited response, or None if it is not rate limiting."""
+        if response.headers.get("X-RateLimit-Remaining") == "0":
+            reset = float(response.headers.get("X-RateLimit-Reset", time.time()))
+            return max(reset - time.time(), 0) + 1
+        if "Retry-After" in response.headers:
+            return float(response.headers["Retry-After"]) * 2 ** attempt
+        if response.status_code == 429 or "rate limit" in response.text.lower():
+            return float(2 ** attempt)
+        return None
+    
+    def _request(self, endpoint: str, params: Optional[Dict] = None, method: str = "GET", **kwargs) -> requests.Response:
+        """Send a request, backing off and retrying when GitHub rate limits it.
+        
+        The adapter's urllib3 Retry only covers 429 and 5xx; GitHub's secondary rate limits
+        answer 403 with Retry-After or X-RateLimit-Remaining: 0, which are handled here.
+        """
+        for attempt in range(self.MAX_RATE_LIMIT_RETRIES + 1):
+            with self._sem:
+                response = self.session.request(method, f"{self.base_url}{endpoint}", params=params, **kwargs)
+            
+            if response.status_code not in (403, 429) or attempt == self.MAX_RATE_LIMIT_RETRIES:
+                return response
+            delay = self._rate_limit_delay(response, attempt)
+            if delay is None or delay > self.MAX_RATE_LIMIT_WAIT:
+                return response
+            print(f"GitHub rate limit hit; retrying in {delay:.0f}s...", file=sys.stderr)
+            response.close()
+            time.sleep(delay)
+        return response
     
     def _get(self, endpoint: str, params: Optional[Dict] = None) -> Dict:
-        """Make a GET request to the GitHub API."""
-        response = requests.get(f"{self.base_url}{endpoint}", headers=self.headers, params=params)
+        """Make a GET request to the GitHub API, revalidating cached responses by ETag."""
+        key = (endpoint, frozenset((params or {}).items()))
+        with self._etag_lock:
+            cached = self._etag_cache.get(key)
+        headers = {"If-None-Match": cached[0]} if cached else None
+        
+        response = self._request(endpoint, params, headers=headers)
+        if cached and response.status_code == 304:
+            with self._etag_lock:
+                if key in self._etag_cache:
+                    self._etag_cache.move_to_end(key)
+            return orjson.loads(cached[1])
+        
         response.raise_for_status()
-        return response.json()
+        body = orjson.loads(response.content)
+        
+        etag = response.headers.get("ETag")
+        if etag:
+            with self._etag_lock:
+                self._etag_cache[key] = (etag, response.content)
+                self._etag_cache.move_to_end(key)
+                if len(self._etag_cache) > self.ETAG_CACHE_SIZE:
+                    self._etag_cache.popitem(last=False)
+        return body
+    
+    def _get_many(self, endpoints: List[str], params: Optional[List[Optional[Dict]]] = None) -> List[Any]:
+        """Make GET requests concurrently on worker threads, returning results in the same order as endpoints.
+        
+        requests releases the GIL while waiting on the socket, so the threads overlap their round trips
+        while still sharing the session's connection pool, retries and ETag cache.
+        """
+        if params is None:
+            params = [None] * len(endpoints)
+        with ThreadPoolExecutor(max_workers=self.MAX_CONCURRENCY) as executor:
+            return list(executor.map(self._get, endpoints, params))
+    
+    def _graphql(self, query: str, variables: Optional[Dict] = None) -> Dict:
+        """Run a query against the GitHub GraphQL API and return its data."""
+        response = self._request("/graphql", method="POST", json={"query": query, "variables": variables or {}})
+        response.raise_for_status()
+        result = orjson.loads(response.content)
+        if result.get("errors"):
+            raise RuntimeError(f"GraphQL error: {result['errors'][0].get('message')}")
+        return result["data"]
+    
+    def _get_stream(self, endpoint: str, params: Optional[Dict] = None) -> Iterator[Dict]:
+        """Stream the items of a JSON array response one at a time instead of buffering the whole body."""
+        with self._request(endpoint, params, stream=True) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            # Floats rather than Decimals, so parsed items stay serializable by orjson
+            yield from ijson.items(response.raw, "item", use_float=True)
+    
+    def _get_paginated(self, endpoint: str, params: Optional[Dict] = None, total: int = MAX_PER_PAGE) -> List[Dict]:
+        """Fetch up to `total` items from a list endpoint, requesting pages beyond the first concurrently."""
+        params = dict(params or {})
+        if total <= MAX_PER_PAGE:
+            return self._get(endpoint, {**params, "per_page": total})
+        
+        # The first page is requested on its own to read how many pages exist
+        response = self._request(endpoint, {**params, "per_page": MAX_PER_PAGE, "page": 1})
+        response.raise_for_status()
+        items = orjson.loads(response.content)
+        
+        last_page = _last_page(response.links)
+        if len(items) >= total or last_page is None:
+            return items[:total]
+        
+        pages = range(2, min(last_page, math.ceil(total / MAX_PER_PAGE)) + 1)
+        results = self._get_many(
+            [endpoint] * len(pages),
+            [{**params, "per_page": MAX_PER_PAGE, "page": page} for page in pages]
+        )
+        for page_items in results:
+            items.extend(page_items)
+        return items[:total]
     
     def get_repository(self, owner: str, repo: str) -> Dict:
         """Get information about a specific repository."""
@@ -39,22 +208,16 @@ class GitHubAPIClient:
     def get_latest_branch(self, owner: str, repo: str) -> Dict:
         """Get the latest branch in a repository by activity."""
         branches = self.get_repository_branches(owner, repo)
-        latest_branch = None
-        latest_date = None
-        
-        for branch in branches:
-            commit_info = self._get(f"/repos/{owner}/{repo}/commits/{branch['commit']['sha']}")
-            commit_date = commit_info['commit']['author']['date']
-            
-            if latest_date is None or commit_date > latest_date:
-                latest_date = commit_date
-                latest_branch = branch
+        if not branches:
+            return None
         
+        commits = self._get_many([f"/repos/{owner}/{repo}/commits/{branch['commit']['sha']}" for branch in branches])
+        latest_branch, _ = max(zip(branches, commits), key=lambda pair: pair[1]['commit']['author']['date'])
         return latest_branch
     
     def get_commit_history(self, owner: str, repo: str, branch: str = "main", count: int = 10) -> List[Dict]:
         """Get recent commit history for a repository."""
-        return self._get(f"/repos/{owner}/{repo}/commits", {"sha": branch, "per_page": count})
+        return self._get_paginated(f"/repos/{owner}/{repo}/commits", {"sha": branch}, count)
     
     def get_weekly_commits(self, owner: str, repo: str) -> int:
         """Count commits from the past week."""
@@ -64,19 +227,36 @@ class GitHubAPIClient:
     
     def get_pull_requests(self, owner: str, repo: str, state: str = "all", count: int = 10) -> List[Dict]:
         """Get pull requests for a repository."""
-        return self._get(f"/repos/{owner}/{repo}/pulls", {"state": state, "per_page": count})
+        return self._get_paginated(f"/repos/{owner}/{repo}/pulls", {"state": state}, count)
     
     def get_recent_merged_prs(self, owner: str, repo: str, count: int = 10) -> List[Dict]:
         """Get recently merged pull requests with merger details."""
-        merged_prs = []
-        prs = self._get(f"/repos/{owner}/{repo}/pulls", {"state": "closed", "per_page": count})
-        
-        for pr in prs:
-            if pr.get('merged_at'):
-                pr_details = self._get(f"/repos/{owner}/{repo}/pulls/{pr['number']}")
-                merged_prs.append(pr_details)
+        if self.token:
+            # One GraphQL query replaces the list call plus one detail call per PR
+            data = self._graphql(MERGED_PRS_QUERY, {"owner": owner, "repo": repo, "count": min(count, MAX_PER_PAGE)})
+            return [
+                # Match the REST pull request shape the rest of the app consumes
+                {
+                    "number": node["number"],
+                    "title": node["title"],
+                    "user": node["author"],
+                    "merged_by": node["mergedBy"],
+                    "created_at": node["createdAt"],
+                    "merged_at": node["mergedAt"],
+                    "html_url": node["url"],
+                }
+                for node in data["repository"]["pullRequests"]["nodes"]
+            ]
         
-        return merged_prs
+        # The GraphQL API requires authentication; fall back to REST with concurrent detail fetches.
+        # Let the search API filter to merged PRs so no detail request is spent on unmerged ones
+        result = self._get("/search/issues", {
+            "q": f"repo:{owner}/{repo} is:pr is:merged",
+            "sort": "updated",
+            "order": "desc",
+            "per_page": min(count, MAX_PER_PAGE)
+        })
+        return self._get_many([f"/repos/{owner}/{repo}/pulls/{item['number']}" for item in result['items']])
     
     def get_contributor_stats(self, owner: str, repo: str) -> List[Dict]:
         """Get detailed contribution statistics for a repository."""
@@ -84,12 +264,30 @@ class GitHubAPIClient:
     
     def get_issues(self, owner: str, repo: str, state: str = "all", count: int = 100) -> List[Dict]:
         """Get issues for a repository."""
-        return self._get(f"/repos/{owner}/{repo}/issues", {"state": state, "per_page": count})
+        return self._get_paginated(f"/repos/{owner}/{repo}/issues", {"state": state}, count)
+    
+    def iter_issues(self, owner: str, repo: str, state: str = "all", count: int = 100) -> Iterator[Dict]:
+        """Lazily yield issues for a repository, streaming each page as it is parsed."""
+        per_page = min(count, MAX_PER_PAGE)
+        yielded = 0
+        page = 1
+        while yielded < count:
+            page_size = 0
+            for issue in self._get_stream(f"/repos/{owner}/{repo}/issues",
+                                          {"state": state, "per_page": per_page, "page": page}):
+                yield issue
+                page_size += 1
+                yielded += 1
+                if yielded >= count:
+                    return
+            if page_size < per_page:
+                return
+            page += 1
     
     def count_issues(self, owner: str, repo: str, state: str = "all") -> int:
         """Count issues in a repository by state."""
-        issues = self.get_issues(owner, repo, state)
-        return len(issues)
+        # Only the count is needed, so stream the issues instead of holding every page in memory
+        return sum(1 for _ in self.iter_issues(owner, repo, state))
     
     def search_repositories(self, query: str, sort: str = "stars", order: str = "desc", count: int = 10) -> Dict:
         """Search for repositories across GitHub."""
@@ -99,6 +297,17 @@ class GitHubAPIClient:
     def get_user_repositories(self, username: str) -> List[Dict]:
         """Get all repositories for a specific user."""
         return self._get(f"/users/{username}/repos")
+    
+    async def get_user_repositories_async(self, username: str) -> List[Dict]:
+        """Get all repositories for a user without blocking the running event loop.
+        
+        The request runs on the event loop itself rather than a worker thread, so cancelling
+        the awaiting task aborts it instead of leaving asyncio.run waiting for it to finish.
+        """
+        async with httpx.AsyncClient(base_url=self.base_url, headers=self.headers, http2=True) as client:
+            response = await client.get(f"/users/{username}/repos")
+            response.raise_for_status()
+            return orjson.loads(response.content)
 
     def get_workflow_runs(self, owner: str, repo: str, workflow_id: str, count: int = 10) -> List[Dict]:
         """Get workflow runs for a specific workflow."""
@@ -106,4 +315,5 @@ class GitHubAPIClient:
     
     def get_workflow_run_details(self, owner: str, repo: str, run_id: int) -> Dict:
         """Get details of a specific workflow run."""
-        return self._get(f"/repos/{owner}/{repo}/actions/runs/{run_id}")
\ No newline at end of file
+        return self._get(f"/repos/{owner}/{repo}/actions/runs/{run_id}")
+
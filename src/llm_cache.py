@@ -0,0 +1,52 @@
+import copy
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+import orjson
+
+class LLMCache:
+    """Process-local LRU cache for deterministic LLM responses."""
+    
+    def __init__(self, max_size: int = 256, ttl: Optional[float] = 3600):
+        self.max_size = max_size
+        self.ttl = ttl
+        # key -> (stored_at, value), least recently used first
+        self._entries: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def make_key(model: str, messages: List[Dict], temperature: float) -> str:
+        """Hash the request fields that determine a response."""
+        payload = orjson.dumps({"model": model, "messages": messages, "temperature": temperature}, option=orjson.OPT_SORT_KEYS)
+        return hashlib.sha256(payload).hexdigest()
+    
+    def get(self, key: str) -> Optional[Any]:
+        """Return a copy of the cached value for key, or None if it is missing or expired."""
+        entry = self._entries.get(key)
+        if entry is not None and self.ttl is not None and time.monotonic() - entry[0] > self.ttl:
+            del self._entries[key]
+            entry = None
+        
+        if entry is None:
+            self.misses += 1
+            return None
+        
+        self._entries.move_to_end(key)
+        self.hits += 1
+        # Callers may mutate the result, so never hand out the stored object
+        return copy.deepcopy(entry[1])
+    
+    def set(self, key: str, value: Any) -> None:
+        """Store value under key, evicting the least recently used entry when full."""
+        self._entries[key] = (time.monotonic(), copy.deepcopy(value))
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Drop all entries and reset the hit/miss counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
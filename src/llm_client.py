@@ -1,83 +1,200 @@
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, AsyncIterator, Iterator, Tuple
+import asyncio
 import json
+import re
+import httpx
+import msgspec
 import openai
+import orjson
 from .config import GROQ_API_KEY, GROQ_BASE_URL, LLM_MODEL
+from .llm_cache import LLMCache
+
+# Connection pool shared by every sync LLMClient, so TLS sessions and HTTP/2 connections to Groq
+# outlive any one client instance
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=64, max_connections=128)
+# openai's own DEFAULT_TIMEOUT is not an httpx.Timeout, so the clients get an explicit one
+_HTTP_TIMEOUT = httpx.Timeout(600.0, connect=5.0)
+_HTTP_CLIENT = httpx.Client(http2=True, limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT)
+
+# System prompt for extracting intent and parameters from a query
+_SYSTEM_PROMPT = """
+You are an AI assistant named Lakshmi that helps interpret natural language queries about GitHub repositories.
+Your task is to:
+1. Identify the intent of the query (e.g., get_contributors, get_commits, search_repositories)
+2. Extract relevant parameters (repository name, owner, branch, etc.)
+3. Format the response as a JSON object with 'intent' and 'parameters' fields
+
+Available intents:
+- get_contributors: Get contributors for a repository
+- get_latest_branch: Get the latest branch in a repository
+- get_commit_history: Get recent commit history
+- get_weekly_commits: Count commits from the past week
+- get_recent_merged_prs: Get recently merged pull requests
+- get_contributor_stats: Get detailed contribution statistics
+- count_issues: Count issues in a repository by state
+- search_repositories: Search for repositories across GitHub
+- search_issues: Search for issues across GitHub
+
+Return ONLY the JSON response without any additional text.
+"""
+
+class IntentResult(msgspec.Struct):
+    """Shape an intent extraction reply must have; decoding validates it in the same pass."""
+    intent: str
+    parameters: Dict[str, Any] = {}
+
+# Contents of the first ```json / ``` fenced block in an LLM reply
+_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)\s*```", re.S)
+_JSON_DECODER = json.JSONDecoder()
+
+# Fields that carry nothing a conversational summary needs but inflate the prompt
+_PROMPT_FIELD_DENYLIST = frozenset({"url", "node_id", "avatar_url", "gravatar_id", "body"})
+
+def _compact(data: Any, max_items: int = 20) -> Any:
+    """Shrink GitHub data for a prompt: truncate long lists, drop nulls, noise fields and API link templates."""
+    if isinstance(data, dict):
+        return {
+            key: _compact(value, max_items) for key, value in data.items()
+            if value is not None and key not in _PROMPT_FIELD_DENYLIST
+            and not (key.endswith("_url") and key != "html_url")
+        }
+    if isinstance(data, list):
+        items = [_compact(item, max_items) for item in data[:max_items]]
+        if len(data) > max_items:
+            # Keep totals answerable even though the tail is cut
+            items.append(f"... {len(data) - max_items} more items omitted (total {len(data)})")
+        return items
+    return data
+
+# System prompt for turning fetched data into a conversational answer
+_GENERATE_SYSTEM_PROMPT = """
+You are an AI assistant that helps analyze GitHub data.
+Given the data and the user's original query, provide a concise and informative response.
+Focus on the most relevant information and insights from the data.
+"""
 
 class LLMClient:
     """Client for interacting with Groq's Language Model APIs."""
     
-    def __init__(self, api_key: str = GROQ_API_KEY, base_url: str = GROQ_BASE_URL, model: str = LLM_MODEL):
+    # Intent extraction is deterministic, which is what makes its responses safe to cache
+    INTENT_TEMPERATURE = 0.0
+    
+    def __init__(self, api_key: str = GROQ_API_KEY, base_url: str = GROQ_BASE_URL, model: str = LLM_MODEL,
+                 max_concurrency: int = 4, cache: Optional[LLMCache] = None):
         self.api_key = api_key
         self.base_url = base_url
         self.model = model
+        # System messages are constant, so build them once and share them across calls
+        self._sys_msg = {"role": "system", "content": _SYSTEM_PROMPT}
+        self._gen_sys_msg = {"role": "system", "content": _GENERATE_SYSTEM_PROMPT}
+        
+        # Optional exact-match cache of parsed intent results
+        self.cache = cache
+        # Upper bound on concurrent requests from process_queries, to stay within Groq's rate limits
+        self.max_concurrency = max_concurrency
         
         # Initialize OpenAI client with Groq's base URL
         self.client = openai.OpenAI(
             base_url=self.base_url,
-            api_key=self.api_key
+            api_key=self.api_key,
+            http_client=_HTTP_CLIENT
+        )
+        # Async counterpart for concurrent calls; the sync methods keep their own client so they
+        # need no event loop (an async client's connection pool is bound to the loop it first ran on,
+        # which is also why it gets its own HTTP/2 pool rather than a module-level one)
+        self.async_client = openai.AsyncOpenAI(
+            base_url=self.base_url,
+            api_key=self.api_key,
+            http_client=httpx.AsyncClient(http2=True, limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT)
         )
         
     def process_query(self, query: str, conversation_history: Optional[List[Dict]] = None) -> Dict:
         """Process a natural language query and extract intent and parameters."""
-        if conversation_history is None:
-            conversation_history = []
-        
-        # Construct the system prompt
-        system_prompt = """
-        You are an AI assistant named Lakshmi that helps interpret natural language queries about GitHub repositories.
-        Your task is to:
-        1. Identify the intent of the query (e.g., get_contributors, get_commits, search_repositories)
-        2. Extract relevant parameters (repository name, owner, branch, etc.)
-        3. Format the response as a JSON object with 'intent' and 'parameters' fields
+        messages = self._query_messages(query, conversation_history)
+        key, cached = self._cached_intent(messages)
+        if cached is not None:
+            return cached
         
-        Available intents:
-        - get_contributors: Get contributors for a repository
-        - get_latest_branch: Get the latest branch in a repository
-        - get_commit_history: Get recent commit history
-        - get_weekly_commits: Count commits from the past week
-        - get_recent_merged_prs: Get recently merged pull requests
-        - get_contributor_stats: Get detailed contribution statistics
-        - count_issues: Count issues in a repository by state
-        - search_repositories: Search for repositories across GitHub
-        - search_issues: Search for issues across GitHub
-        
-        Return ONLY the JSON response without any additional text.
-        """
-        
-        # Build the messages
-        messages = [
-            {"role": "system", "content": system_prompt},
-        ]
-        
-        # Add conversation history
-        for message in conversation_history:
-            messages.append(message)
-        
-        # Add the current query
-        messages.append({"role": "user", "content": query})
-        
-        # Make the API call
         response = self.client.chat.completions.create(
             model=self.model,
             messages=messages,
-            temperature=0.0,
+            temperature=self.INTENT_TEMPERATURE,
         )
+        return self._store_intent(key, self._parse_intent(response))
+    
+    async def aprocess_query(self, query: str, conversation_history: Optional[List[Dict]] = None) -> Dict:
+        """Asynchronously process a natural language query and extract intent and parameters."""
+        messages = self._query_messages(query, conversation_history)
+        key, cached = self._cached_intent(messages)
+        if cached is not None:
+            return cached
         
-        # Extract and parse the JSON response
+        response = await self.async_client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            temperature=self.INTENT_TEMPERATURE,
+        )
+        return self._store_intent(key, self._parse_intent(response))
+    
+    def _cached_intent(self, messages: List[Dict]) -> Tuple[Optional[str], Optional[Dict]]:
+        """Look up a previously parsed intent for these exact messages."""
+        if self.cache is None or self.INTENT_TEMPERATURE != 0.0:
+            return None, None
+        key = self.cache.make_key(self.model, messages, self.INTENT_TEMPERATURE)
+        return key, self.cache.get(key)
+    
+    def _store_intent(self, key: Optional[str], result: Any) -> Any:
+        """Cache a successfully parsed intent under key and return it."""
+        if key is not None and isinstance(result, dict) and result.get("intent") != "error":
+            self.cache.set(key, result)
+        return result
+    
+    async def process_queries(self, queries: List[str], conversation_history: Optional[List[Dict]] = None) -> List[Dict]:
+        """Process several queries concurrently, returning one intent result per query in order."""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def run(query: str) -> Dict:
+            async with semaphore:
+                return await self.aprocess_query(query, conversation_history)
+        
+        results = await asyncio.gather(*(run(query) for query in queries), return_exceptions=True)
+        return [
+            {"intent": "error", "parameters": {"error": str(result)}} if isinstance(result, Exception) else result
+            for result in results
+        ]
+    
+    def _query_messages(self, query: str, conversation_history: Optional[List[Dict]] = None) -> List[Dict]:
+        """Build the chat messages for intent extraction."""
+        return [self._sys_msg, *(conversation_history or ()), {"role": "user", "content": query}]
+    
+    @staticmethod
+    def _parse_intent(response: Any) -> Dict:
+        """Extract and parse the JSON intent from a chat completion.
+        
+        Replies that are not JSON come back as an "error" intent. Replies that are JSON but not
+        shaped like IntentResult raise msgspec.ValidationError, so callers can fall back to
+        pattern matching instead of stopping on an error.
+        """
         try:
             response_text = response.choices[0].message.content
-            # Sometimes the LLM might wrap the JSON in backticks, so we need to clean it
-            if response_text.startswith("```json"):
-                response_text = response_text.replace("```json", "", 1)
-                if response_text.endswith("```"):
-                    response_text = response_text[:-3]
-            elif response_text.startswith("```"):
-                response_text = response_text.replace("```", "", 1)
-                if response_text.endswith("```"):
-                    response_text = response_text[:-3]
-                
-            return json.loads(response_text.strip())
-        except (json.JSONDecodeError, IndexError, AttributeError) as e:
+            # Sometimes the LLM might wrap the JSON in backticks (possibly with text around it)
+            match = _FENCE_RE.search(response_text)
+            response_text = (match.group(1) if match else response_text).strip()
+            
+            try:
+                result = msgspec.json.decode(response_text, type=IntentResult)
+            except msgspec.ValidationError:
+                raise
+            except msgspec.DecodeError:
+                # Tolerate prose around the object by decoding from its first brace
+                start = response_text.find("{")
+                if start == -1:
+                    raise
+                result = msgspec.convert(_JSON_DECODER.raw_decode(response_text, start)[0], IntentResult)
+            return msgspec.to_builtins(result)
+        except msgspec.ValidationError:
+            raise
+        except (msgspec.DecodeError, json.JSONDecodeError, IndexError, AttributeError, TypeError) as e:
             return {
                 "intent": "error",
                 "parameters": {"error": str(e), "raw_response": str(response)}
@@ -85,21 +202,44 @@ class LLMClient:
     
     def generate_response(self, data: Dict, query: str) -> str:
         """Generate a conversational response based on query and data."""
-        system_prompt = """
-        You are an AI assistant that helps analyze GitHub data.
-        Given the data and the user's original query, provide a concise and informative response.
-        Focus on the most relevant information and insights from the data.
-        """
-        
-        messages = [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": f"Original query: {query}\n\nData: {json.dumps(data, indent=2)}"}
-        ]
-        
+        return "".join(self.generate_response_stream(data, query))
+    
+    def generate_response_stream(self, data: Dict, query: str) -> Iterator[str]:
+        """Generate a conversational response, yielding text chunks as the model produces them."""
         response = self.client.chat.completions.create(
             model=self.model,
-            messages=messages,
+            messages=self._response_messages(data, query),
             temperature=0.7,
+            stream=True,
         )
         
-        return response.choices[0].message.content
\ No newline at end of file
+        for chunk in response:
+            # The final chunk may carry only usage data and no choices
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+    
+    async def agenerate_response(self, data: Dict, query: str) -> str:
+        """Asynchronously generate a conversational response based on query and data."""
+        return "".join([chunk async for chunk in self.generate_response_astream(data, query)])
+    
+    async def generate_response_astream(self, data: Dict, query: str) -> AsyncIterator[str]:
+        """Asynchronously generate a conversational response, yielding text chunks as they arrive."""
+        response = await self.async_client.chat.completions.create(
+            model=self.model,
+            messages=self._response_messages(data, query),
+            temperature=0.7,
+            stream=True,
+        )
+        
+        async for chunk in response:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+    
+    def _response_messages(self, data: Dict, query: str) -> List[Dict]:
+        """Build the chat messages for a conversational response."""
+        messages = [
+            self._gen_sys_msg,
+            {"role": "user", "content": f"Original query: {query}\n\nData: {orjson.dumps(_compact(data)).decode()}"}
+        ]
+        
+        return messages
\ No newline at end of file
@@ -1,11 +1,45 @@
+import matplotlib.colors as mcolors
 import matplotlib.pyplot as plt
-import seaborn as sns
+from matplotlib.axes import Axes
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+import numpy as np
 import pandas as pd
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+import io
 import os
 from rich.console import Console
 from rich.table import Table
 
+# Figure size and layout engine for each chart kind (constrained layout instead of a tight_layout pass)
+_CHART_FIGURES = {
+    'contributors': ((10, 6), 'constrained'),
+    'commits_over_time': ((12, 6), 'constrained'),
+    'issue_distribution': ((8, 8), None),
+    'prs_by_author': ((10, 6), 'constrained'),
+    'repository_stars': ((12, 8), 'constrained'),
+}
+
+# Per-process Visualizer used by render_all workers, so each worker reuses one figure
+_worker_visualizer = None
+
+def _render(spec: Dict[str, Any]) -> bytes:
+    """Draw one chart spec on a worker's off-screen figure and return it as PNG bytes."""
+    global _worker_visualizer
+    if _worker_visualizer is None:
+        _worker_visualizer = Visualizer()
+    
+    chart = spec['chart']
+    ax = _worker_visualizer._offscreen_axes(chart)
+    getattr(_worker_visualizer, f'_draw_{chart}')(ax, spec['data'], **spec.get('options', {}))
+    
+    buffer = io.BytesIO()
+    ax.figure.savefig(buffer, format='png')
+    ax.figure.clear()
+    return buffer.getvalue()
+
 class Visualizer:
     """Visualize GitHub data in various formats."""
     
@@ -16,6 +50,15 @@ class Visualizer:
         # Set up matplotlib style
         plt.style.use('seaborn-v0_8-darkgrid')
         self.colors = ['#3498db', '#2ecc71', '#e74c3c', '#f39c12', '#9b59b6', '#1abc9c']
+        # Palette parsed to RGBA once, so charts index into it instead of re-parsing hex strings
+        self._rgba = np.array([mcolors.to_rgba(color) for color in self.colors])
+        
+        # Off-screen figure reused by every chart saved to disk; rendered by Agg without any GUI backend
+        self._fig = Figure()
+        FigureCanvasAgg(self._fig)
+        
+        # Output directories already created, so repeated saves skip the makedirs syscalls
+        self._ensured_dirs = set()
     
     def show_console_table(self, df: pd.DataFrame, title: str) -> None:
         """Display data as a table in the console using rich."""
@@ -25,124 +68,194 @@ class Visualizer:
         for column in df.columns:
             table.add_column(column, style="dim")
         
-        # Add rows
-        for _, row in df.iterrows():
-            table.add_row(*[str(val) for val in row.values])
+        # Add rows; each column is cast to str once, then the columns are zipped back into rows
+        rows = zip(*(df[column].astype(str).to_numpy() for column in df.columns))
+        for row in rows:
+            table.add_row(*row)
         
         # Print table
         self.console.print(table)
     
-    def plot_contributors(self, df: pd.DataFrame, limit: int = 10, save_path: Optional[str] = None) -> str:
-        """Plot top contributors by contribution count."""
-        # Take top N contributors
-        if len(df) > limit:
-            df = df.nlargest(limit, 'Contributions')
-        
-        plt.figure(figsize=(10, 6))
-        sns.barplot(x='Contributions', y='Username', data=df, palette=self.colors)
-        plt.title('Top Contributors')
-        plt.xlabel('Number of Contributions')
-        plt.ylabel('Username')
-        plt.tight_layout()
-        
+    def _offscreen_axes(self, chart: str) -> Axes:
+        """Axes on the reused off-screen figure, cleared and sized for the given chart kind."""
+        figsize, layout = _CHART_FIGURES[chart]
+        self._fig.clear()
+        self._fig.set_layout_engine(layout)
+        self._fig.set_size_inches(*figsize)
+        return self._fig.add_subplot(111)
+    
+    def _new_axes(self, chart: str, save_path: Optional[str]) -> Axes:
+        """Axes to draw a chart on: the reused off-screen figure when saving, a pyplot window otherwise."""
         if save_path:
-            # Create directory if it doesn't exist
-            os.makedirs(os.path.dirname(save_path), exist_ok=True)
-            plt.savefig(save_path)
-            plt.close()
+            return self._offscreen_axes(chart)
+        figsize, layout = _CHART_FIGURES[chart]
+        return plt.figure(figsize=figsize, layout=layout).add_subplot(111)
+    
+    def _ensure_dir(self, path: str) -> None:
+        """Create the directory of path if it doesn't exist yet."""
+        directory = os.path.dirname(path)
+        if directory and directory not in self._ensured_dirs:
+            os.makedirs(directory, exist_ok=True)
+            self._ensured_dirs.add(directory)
+    
+    def _finish(self, ax: Axes, save_path: Optional[str]) -> str:
+        """Save the chart and reset the reused figure, or show it interactively."""
+        if save_path:
+            self._ensure_dir(save_path)
+            ax.figure.savefig(save_path)
+            ax.figure.clear()
             return save_path
         else:
             plt.show()
             return ""
     
+    @staticmethod
+    def _top(df: pd.DataFrame, column: str, limit: int) -> pd.DataFrame:
+        """Top rows by column, skipping the heap when the API already returned them sorted."""
+        if df[column].is_monotonic_decreasing:
+            return df.head(limit)
+        return df.nlargest(limit, column)
+    
+    @staticmethod
+    def _is_empty(data) -> bool:
+        """Whether there is nothing to plot, so the figure pipeline can be skipped entirely."""
+        return data is None or len(data) == 0
+    
+    def _palette(self, n: int) -> np.ndarray:
+        """RGBA colors for n items, cycling through the palette."""
+        return self._rgba[np.arange(n) % len(self._rgba)]
+    
+    def _barh(self, ax: Axes, labels, values) -> None:
+        """Draw already-aggregated values as horizontal bars, first item at the top."""
+        positions = range(len(values))
+        ax.barh(positions, values, color=self._palette(len(values)))
+        ax.set_yticks(positions, labels)
+        ax.invert_yaxis()
+    
+    def render_all(self, specs: Dict[str, Dict[str, Any]], max_workers: Optional[int] = None) -> Dict[str, str]:
+        """Render several charts in parallel worker processes and save them to disk.
+        
+        Each spec names a chart kind ('contributors', 'commits_over_time', 'issue_distribution',
+        'prs_by_author' or 'repository_stars') under 'chart', the input of the matching plot_*
+        method under 'data', a 'save_path', and optional keyword 'options' such as {'limit': 5}.
+        Returns the saved path for each spec name, or an empty string if its data was empty.
+        """
+        # Charts without data are never sent to a worker, like the plot_* methods they report no path
+        saved = {name: "" for name, spec in specs.items() if self._is_empty(spec['data'])}
+        names = [name for name in specs if name not in saved]
+        if not names:
+            return saved
+        
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            images = executor.map(_render, (specs[name] for name in names))
+            
+            # Workers only rasterize; files are written here as each image comes back
+            for name, image in zip(names, images):
+                save_path = specs[name]['save_path']
+                self._ensure_dir(save_path)
+                with open(save_path, 'wb') as f:
+                    f.write(image)
+                saved[name] = save_path
+        
+        return saved
+    
+    def plot_contributors(self, df: pd.DataFrame, limit: int = 10, save_path: Optional[str] = None) -> str:
+        """Plot top contributors by contribution count."""
+        if self._is_empty(df):
+            return ""
+        
+        ax = self._new_axes('contributors', save_path)
+        self._draw_contributors(ax, df, limit)
+        return self._finish(ax, save_path)
+    
+    def _draw_contributors(self, ax: Axes, df: pd.DataFrame, limit: int = 10) -> None:
+        """Draw top contributors onto ax."""
+        # Take top N contributors
+        if len(df) > limit:
+            df = self._top(df, 'Contributions', limit)
+        
+        self._barh(ax, df['Username'], df['Contributions'])
+        ax.set_title('Top Contributors')
+        ax.set_xlabel('Number of Contributions')
+        ax.set_ylabel('Username')
+    
     def plot_commits_over_time(self, df: pd.DataFrame, save_path: Optional[str] = None) -> str:
         """Plot commits over time."""
+        if self._is_empty(df):
+            return ""
+        
+        ax = self._new_axes('commits_over_time', save_path)
+        self._draw_commits_over_time(ax, df)
+        return self._finish(ax, save_path)
+    
+    def _draw_commits_over_time(self, ax: Axes, df: pd.DataFrame) -> None:
+        """Draw daily commit counts onto ax."""
         # Convert Date to datetime
         df['Date'] = pd.to_datetime(df['Date'])
         
-        # Count commits by date
-        commits_by_date = df.groupby(df['Date'].dt.date).size().reset_index(name='Count')
-        
-        plt.figure(figsize=(12, 6))
-        plt.plot(commits_by_date['Date'], commits_by_date['Count'], marker='o', linestyle='-', color=self.colors[0])
-        plt.title('Commits Over Time')
-        plt.xlabel('Date')
-        plt.ylabel('Number of Commits')
-        plt.grid(True, linestyle='--', alpha=0.7)
-        plt.tight_layout()
+        # Count commits by day, keeping the keys as datetime64 rather than Python date objects
+        commits_by_date = df['Date'].dt.floor('D').value_counts().sort_index()
         
-        if save_path:
-            # Create directory if it doesn't exist
-            os.makedirs(os.path.dirname(save_path), exist_ok=True)
-            plt.savefig(save_path)
-            plt.close()
-            return save_path
-        else:
-            plt.show()
-            return ""
+        ax.plot(commits_by_date.index, commits_by_date.values, marker='o', linestyle='-', color=self.colors[0])
+        ax.set_title('Commits Over Time')
+        ax.set_xlabel('Date')
+        ax.set_ylabel('Number of Commits')
+        ax.grid(True, linestyle='--', alpha=0.7)
     
     def plot_issue_distribution(self, issues: List[Dict], save_path: Optional[str] = None) -> str:
         """Plot distribution of issues by state."""
-        # Count issues by state
-        states = [issue['state'] for issue in issues]
-        state_counts = pd.Series(states).value_counts()
+        if self._is_empty(issues):
+            return ""
         
-        plt.figure(figsize=(8, 8))
-        plt.pie(state_counts, labels=state_counts.index, autopct='%1.1f%%', colors=self.colors, startangle=90)
-        plt.title('Issue Distribution by State')
-        plt.axis('equal')
+        ax = self._new_axes('issue_distribution', save_path)
+        self._draw_issue_distribution(ax, issues)
+        return self._finish(ax, save_path)
+    
+    def _draw_issue_distribution(self, ax: Axes, issues: List[Dict]) -> None:
+        """Draw the issue state breakdown onto ax."""
+        # Count issues by state
+        state_counts = Counter(issue['state'] for issue in issues).most_common()
+        labels, counts = zip(*state_counts)
         
-        if save_path:
-            # Create directory if it doesn't exist
-            os.makedirs(os.path.dirname(save_path), exist_ok=True)
-            plt.savefig(save_path)
-            plt.close()
-            return save_path
-        else:
-            plt.show()
-            return ""
+        ax.pie(counts, labels=labels, autopct='%1.1f%%', colors=self._palette(len(counts)), startangle=90)
+        ax.set_title('Issue Distribution by State')
+        ax.axis('equal')
     
     def plot_prs_by_author(self, df: pd.DataFrame, limit: int = 10, save_path: Optional[str] = None) -> str:
         """Plot pull requests by author."""
-        # Count PRs by author
-        pr_counts = df['Author'].value_counts().nlargest(limit)
+        if self._is_empty(df):
+            return ""
         
-        plt.figure(figsize=(10, 6))
-        sns.barplot(x=pr_counts.values, y=pr_counts.index, palette=self.colors)
-        plt.title('Pull Requests by Author')
-        plt.xlabel('Number of Pull Requests')
-        plt.ylabel('Author')
-        plt.tight_layout()
+        ax = self._new_axes('prs_by_author', save_path)
+        self._draw_prs_by_author(ax, df, limit)
+        return self._finish(ax, save_path)
+    
+    def _draw_prs_by_author(self, ax: Axes, df: pd.DataFrame, limit: int = 10) -> None:
+        """Draw pull request counts per author onto ax."""
+        # Count PRs by author
+        pr_counts = df['Author'].value_counts().head(limit)
         
-        if save_path:
-            # Create directory if it doesn't exist
-            os.makedirs(os.path.dirname(save_path), exist_ok=True)
-            plt.savefig(save_path)
-            plt.close()
-            return save_path
-        else:
-            plt.show()
-            return ""
+        self._barh(ax, pr_counts.index, pr_counts.values)
+        ax.set_title('Pull Requests by Author')
+        ax.set_xlabel('Number of Pull Requests')
+        ax.set_ylabel('Author')
     
     def plot_repository_stars(self, df: pd.DataFrame, limit: int = 10, save_path: Optional[str] = None) -> str:
         """Plot repositories by star count."""
+        if self._is_empty(df):
+            return ""
+        
+        ax = self._new_axes('repository_stars', save_path)
+        self._draw_repository_stars(ax, df, limit)
+        return self._finish(ax, save_path)
+    
+    def _draw_repository_stars(self, ax: Axes, df: pd.DataFrame, limit: int = 10) -> None:
+        """Draw top repositories by stars onto ax."""
         # Take top N repositories
         if len(df) > limit:
-            df = df.nlargest(limit, 'Stars')
-        
-        plt.figure(figsize=(12, 8))
-        sns.barplot(x='Stars', y='Name', data=df, palette=self.colors)
-        plt.title('Top Repositories by Stars')
-        plt.xlabel('Number of Stars')
-        plt.ylabel('Repository')
-        plt.tight_layout()
+            df = self._top(df, 'Stars', limit)
         
-        if save_path:
-            # Create directory if it doesn't exist
-            os.makedirs(os.path.dirname(save_path), exist_ok=True)
-            plt.savefig(save_path)
-            plt.close()
-            return save_path
-        else:
-            plt.show()
-            return ""
\ No newline at end of file
+        self._barh(ax, df['Name'], df['Stars'])
+        ax.set_title('Top Repositories by Stars')
+        ax.set_xlabel('Number of Stars')
+        ax.set_ylabel('Repository')
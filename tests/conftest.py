@@ -0,0 +1,4 @@
+import os
+
+# The LLM client refuses to build without an API key; tests never reach the network
+os.environ.setdefault("GROQ_API_KEY", "test-key")
@@ -0,0 +1,67 @@
+import msgspec
+import pytest
+
+from src.cli import GitXRCLI
+
+
+class FakeGitHubClient:
+    """Stands in for GitHubAPIClient and records which endpoints the handlers called."""
+
+    def __init__(self):
+        self.calls = []
+
+    def get_repository_contributors(self, owner, repo):
+        self.calls.append(("contributors", owner, repo))
+        return [{"login": "a", "contributions": 3, "html_url": "https://github.com/a"}]
+
+    def get_user_repositories(self, username):
+        self.calls.append(("repositories", username))
+        return [{
+            "name": "r", "description": None, "stargazers_count": 1, "forks_count": 0,
+            "updated_at": "2024-01-01T00:00:00Z", "html_url": "https://github.com/a/r",
+        }]
+
+    def search_repositories(self, query, sort="stars"):
+        self.calls.append(("search", query))
+        raise RuntimeError("search unavailable")
+
+
+@pytest.fixture
+def cli():
+    cli = GitXRCLI()
+    cli.github_client = FakeGitHubClient()
+    return cli
+
+
+def test_intent_is_dispatched_to_its_handler(cli):
+    result = cli.execute_intent({"intent": "get_contributors", "parameters": {"owner": "o", "repo": "r"}})
+    assert result == {"contributors": [{"login": "a", "contributions": 3, "html_url": "https://github.com/a"}]}
+    assert cli.github_client.calls == [("contributors", "o", "r")]
+
+
+def test_alias_resolves_to_canonical_handler(cli):
+    result = cli.execute_intent({"intent": "get_repos", "parameters": {"username": "a"}})
+    assert [repo["name"] for repo in result["repositories"]] == ["r"]
+    assert cli.github_client.calls == [("repositories", "a")]
+
+
+def test_unhandled_intent_is_reported(cli):
+    assert cli.execute_intent({"intent": "delete_repository", "parameters": {}}) == {
+        "error": "Unhandled intent: delete_repository"
+    }
+    assert cli.github_client.calls == []
+
+
+def test_handler_errors_are_returned_not_raised(cli):
+    result = cli.execute_intent({"intent": "search_repositories", "parameters": {"query": "x"}})
+    assert result == {"error": "search unavailable"}
+
+
+def test_wrongly_shaped_llm_reply_falls_back_to_pattern_matching(cli, monkeypatch):
+    def reject(query, history):
+        raise msgspec.ValidationError("Expected `object`, got `array`")
+
+    monkeypatch.setattr(cli.llm_client, "process_query", reject)
+    monkeypatch.setattr(cli.llm_client, "generate_response_stream", lambda result, query: iter(["done"]))
+    cli.process_query("search repos about pandas")
+    assert cli.github_client.calls == [("search", "about pandas")]
@@ -0,0 +1,37 @@
+from src.data_processing import DataProcessor
+
+
+def test_flatten_projects_only_requested_paths():
+    records = [{"name": "r", "owner": {"login": "a", "site": {"url": "u"}}, "license": {"key": "mit"}}]
+    df = DataProcessor._flatten(records, ["name", "owner.site.url"])
+    assert list(df.columns) == ["name", "owner.site.url"]
+    assert df.to_dict("records") == [{"name": "r", "owner.site.url": "u"}]
+
+
+def test_flatten_missing_or_null_parents_yield_none():
+    records = [{"merged_by": None}, {}, {"merged_by": {"login": "a"}}]
+    assert DataProcessor._flatten(records, ["merged_by.login"])["merged_by.login"].tolist() == [None, None, "a"]
+
+
+def test_flatten_empty_input_keeps_columns():
+    df = DataProcessor._flatten([], ["name", "owner.login"])
+    assert df.empty
+    assert list(df.columns) == ["name", "owner.login"]
+
+
+def test_repository_search_defaults_missing_language_and_description():
+    results = [{
+        "name": "r", "owner": {"login": "a"}, "stargazers_count": 1, "forks_count": 0,
+        "language": None, "description": None, "html_url": "https://github.com/a/r",
+    }]
+    df = DataProcessor.search_results_to_dataframe(results, 'repositories')
+    assert df.loc[0, 'Language'] == 'N/A'
+    assert df.loc[0, 'Description'] == 'N/A'
+
+
+def test_flatten_streams_non_list_input_in_chunks(monkeypatch):
+    monkeypatch.setattr(DataProcessor, "STREAM_CHUNK_SIZE", 2)
+    records = [{"number": n, "user": {"login": f"u{n}"}} for n in range(5)]
+    streamed = DataProcessor._flatten(iter(records), ["number", "user.login"])
+    assert streamed.to_dict("records") == DataProcessor._flatten(records, ["number", "user.login"]).to_dict("records")
+    assert DataProcessor._flatten(iter([]), ["number"]).empty
@@ -0,0 +1,196 @@
+import io
+
+import orjson
+import pytest
+import requests
+
+from src import github_api
+from src.github_api import GitHubAPIClient, _last_page
+
+LAST_LINK = '<https://api.github.com/repos/o/r/commits?per_page=100&page={page}>; rel="last"'
+
+
+def make_response(body, last_page=None, status=200, headers=None):
+    response = requests.Response()
+    response.status_code = status
+    response._content = orjson.dumps(body) if body is not None else b""
+    response.raw = io.BytesIO()
+    response.url = "https://api.github.com/repos/o/r/commits"
+    response.headers.update(headers or {})
+    if last_page is not None:
+        response.headers["Link"] = LAST_LINK.format(page=last_page)
+    return response
+
+
+class FakeSession:
+    """Serves fixed pages of `page_size` numbered items and records the requested page numbers."""
+
+    def __init__(self, total_items, page_size=100):
+        self.total_items = total_items
+        self.page_size = page_size
+        self.pages = []
+
+    def request(self, method, url, params=None, **kwargs):
+        page = params.get("page", 1)
+        per_page = params["per_page"]
+        self.pages.append(page)
+        start = (page - 1) * per_page
+        items = list(range(start, min(start + per_page, self.total_items)))
+        last_page = -(-self.total_items // per_page)
+        return make_response(items, last_page if last_page > 1 else None)
+
+
+class ETagSession:
+    """Serves one body with an ETag, answering 304 Not Modified when that ETag is sent back."""
+
+    def __init__(self, body, etag='"v1"'):
+        self.body = body
+        self.etag = etag
+        self.statuses = []
+
+    def request(self, method, url, params=None, headers=None, **kwargs):
+        if headers and headers.get("If-None-Match") == self.etag:
+            response = make_response(None, status=304)
+        else:
+            response = make_response(self.body, headers={"ETag": self.etag})
+        self.statuses.append(response.status_code)
+        return response
+
+
+class ScriptedSession:
+    """Returns the given responses in order, one per request."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    def request(self, method, url, params=None, **kwargs):
+        self.calls.append((method, url))
+        return self.responses.pop(0)
+
+
+def make_client(session):
+    client = GitHubAPIClient(token="t")
+    client.session = session
+    return client
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    delays = []
+    monkeypatch.setattr(github_api.time, "sleep", delays.append)
+    return delays
+
+
+def test_last_page_reads_page_number_from_link():
+    assert _last_page({"last": {"url": "https://api.github.com/x?per_page=100&page=7"}}) == 7
+    assert _last_page({}) is None
+
+
+def test_single_page_request_uses_total_as_page_size():
+    session = FakeSession(total_items=50)
+    assert make_client(session)._get_paginated("/repos/o/r/commits", total=10) == list(range(10))
+    assert session.pages == [1]
+
+
+def test_fetches_only_the_pages_needed_for_total():
+    session = FakeSession(total_items=1000)
+    items = make_client(session)._get_paginated("/repos/o/r/commits", total=250)
+    assert items == list(range(250))
+    assert sorted(session.pages) == [1, 2, 3]
+
+
+def test_stops_at_last_page_when_fewer_items_exist():
+    session = FakeSession(total_items=150)
+    items = make_client(session)._get_paginated("/repos/o/r/commits", total=500)
+    assert items == list(range(150))
+    assert sorted(session.pages) == [1, 2]
+
+
+def test_no_link_header_returns_first_page():
+    session = FakeSession(total_items=80)
+    assert make_client(session)._get_paginated("/repos/o/r/commits", total=300) == list(range(80))
+    assert session.pages == [1]
+
+
+def test_not_modified_response_is_served_from_etag_cache():
+    session = ETagSession([{"login": "a"}])
+    client = make_client(session)
+    assert client._get("/repos/o/r/contributors") == [{"login": "a"}]
+    assert client._get("/repos/o/r/contributors") == [{"login": "a"}]
+    assert session.statuses == [200, 304]
+
+
+def test_etag_cache_hits_return_independent_objects():
+    client = make_client(ETagSession([{"login": "a"}]))
+    client._get("/repos/o/r/contributors")[0]["login"] = "changed"
+    client._get("/repos/o/r/contributors")[0]["login"] = "changed again"
+    assert client._get("/repos/o/r/contributors") == [{"login": "a"}]
+
+
+def test_etag_cache_is_keyed_by_params():
+    session = ETagSession([])
+    client = make_client(session)
+    client._get("/repos/o/r/issues", {"state": "open"})
+    client._get("/repos/o/r/issues", {"state": "closed"})
+    client._get("/repos/o/r/issues", {"state": "open"})
+    assert session.statuses == [200, 200, 304]
+
+
+def test_retry_after_is_honoured_on_secondary_rate_limit(sleeps, capsys):
+    session = ScriptedSession(
+        make_response({"message": "slow down"}, status=403, headers={"Retry-After": "2"}),
+        make_response([1]),
+    )
+    assert make_client(session)._get("/repos/o/r/commits") == [1]
+    assert sleeps == [2.0]
+    assert "retrying in 2s" in capsys.readouterr().err
+
+
+def test_backoff_doubles_on_each_attempt(sleeps):
+    session = ScriptedSession(*[make_response(None, status=429)] * 3, make_response([1]))
+    assert make_client(session)._get("/repos/o/r/commits") == [1]
+    assert sleeps == [1.0, 2.0, 4.0]
+
+
+def test_exhausted_primary_rate_limit_waits_for_reset(sleeps, monkeypatch):
+    monkeypatch.setattr(github_api.time, "time", lambda: 1000.0)
+    limited = make_response(None, status=403, headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1010"})
+    session = ScriptedSession(limited, make_response([1]))
+    assert make_client(session)._get("/repos/o/r/commits") == [1]
+    assert sleeps == [11.0]
+
+
+def test_distant_rate_limit_reset_is_reported_instead_of_waited_for(sleeps, monkeypatch):
+    monkeypatch.setattr(github_api.time, "time", lambda: 1000.0)
+    limited = make_response(None, status=403, headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "4600"})
+    session = ScriptedSession(limited)
+    with pytest.raises(requests.HTTPError):
+        make_client(session)._get("/repos/o/r/commits")
+    assert sleeps == []
+    assert len(session.calls) == 1
+
+
+def test_forbidden_without_rate_limit_is_not_retried(sleeps):
+    session = ScriptedSession(make_response({"message": "Resource not accessible"}, status=403))
+    with pytest.raises(requests.HTTPError):
+        make_client(session)._get("/repos/o/r/commits")
+    assert sleeps == []
+
+
+def test_gives_up_after_max_retries(sleeps):
+    retries = GitHubAPIClient.MAX_RATE_LIMIT_RETRIES
+    session = ScriptedSession(*[make_response(None, status=429)] * (retries + 1))
+    with pytest.raises(requests.HTTPError):
+        make_client(session)._get("/repos/o/r/commits")
+    assert len(sleeps) == retries
+
+
+def test_graphql_requests_back_off_like_rest_requests(sleeps):
+    session = ScriptedSession(
+        make_response(None, status=403, headers={"Retry-After": "1"}),
+        make_response({"data": {"viewer": {"login": "a"}}}),
+    )
+    assert make_client(session)._graphql("{ viewer { login } }") == {"viewer": {"login": "a"}}
+    assert session.calls == [("POST", "https://api.github.com/graphql")] * 2
+    assert sleeps == [1.0]
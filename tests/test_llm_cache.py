@@ -0,0 +1,58 @@
+from src import llm_cache
+from src.llm_cache import LLMCache
+
+
+def test_get_returns_stored_value_and_counts_hits_and_misses():
+    cache = LLMCache()
+    assert cache.get("k") is None
+    cache.set("k", {"intent": "get_contributors"})
+    assert cache.get("k") == {"intent": "get_contributors"}
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_get_returns_a_copy():
+    cache = LLMCache()
+    cache.set("k", {"parameters": {"owner": "a"}})
+    cache.get("k")["parameters"]["owner"] = "b"
+    assert cache.get("k") == {"parameters": {"owner": "a"}}
+
+
+def test_evicts_least_recently_used_entry_when_full():
+    cache = LLMCache(max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")  # "b" is now the least recently used
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_expired_entries_are_dropped(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(llm_cache.time, "monotonic", lambda: now[0])
+    cache = LLMCache(ttl=10)
+    cache.set("k", "v")
+    now[0] += 5
+    assert cache.get("k") == "v"
+    now[0] += 6
+    assert cache.get("k") is None
+    assert "k" not in cache._entries
+
+
+def test_make_key_ignores_dict_ordering_but_not_content():
+    messages = [{"role": "user", "content": "hi"}]
+    reordered = [{"content": "hi", "role": "user"}]
+    key = LLMCache.make_key("model", messages, 0.0)
+    assert key == LLMCache.make_key("model", reordered, 0.0)
+    assert key != LLMCache.make_key("model", messages, 0.7)
+    assert key != LLMCache.make_key("other", messages, 0.0)
+
+
+def test_clear_resets_entries_and_counters():
+    cache = LLMCache()
+    cache.set("k", "v")
+    cache.get("k")
+    cache.clear()
+    assert cache.get("k") is None
+    assert (cache.hits, cache.misses) == (0, 1)
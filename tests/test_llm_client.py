@@ -0,0 +1,98 @@
+from types import SimpleNamespace
+
+import httpx
+import msgspec
+import pytest
+
+from src import llm_client
+from src.llm_client import LLMClient, _compact
+
+
+def completion(content):
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+class TestParseIntent:
+    def test_plain_json(self):
+        result = LLMClient._parse_intent(completion('{"intent": "get_contributors", "parameters": {"owner": "a", "repo": "b"}}'))
+        assert result == {"intent": "get_contributors", "parameters": {"owner": "a", "repo": "b"}}
+
+    def test_fenced_json_with_surrounding_text(self):
+        result = LLMClient._parse_intent(completion('Sure:\n```json\n{"intent": "count_issues", "parameters": {}}\n```\nDone.'))
+        assert result == {"intent": "count_issues", "parameters": {}}
+
+    def test_bare_fence(self):
+        result = LLMClient._parse_intent(completion('```\n{"intent": "count_issues", "parameters": {}}\n```'))
+        assert result == {"intent": "count_issues", "parameters": {}}
+
+    def test_prose_around_object_uses_raw_decode_fallback(self):
+        result = LLMClient._parse_intent(completion('The intent is {"intent": "search_repositories", "parameters": {"query": "x"}} as requested.'))
+        assert result == {"intent": "search_repositories", "parameters": {"query": "x"}}
+
+    def test_non_json_reply_is_an_error_intent(self):
+        result = LLMClient._parse_intent(completion("I cannot help with that."))
+        assert result["intent"] == "error"
+        assert "error" in result["parameters"]
+
+    def test_missing_choices_is_an_error_intent(self):
+        assert LLMClient._parse_intent(SimpleNamespace(choices=[]))["intent"] == "error"
+
+    def test_missing_content_is_an_error_intent(self):
+        assert LLMClient._parse_intent(completion(None))["intent"] == "error"
+
+    def test_missing_parameters_default_to_empty(self):
+        assert LLMClient._parse_intent(completion('{"intent": "count_issues"}')) == {"intent": "count_issues", "parameters": {}}
+
+    @pytest.mark.parametrize("content", ['[1, 2]', '{"intent": null}', '{"intent": "x", "parameters": []}'])
+    def test_wrongly_shaped_reply_raises(self, content):
+        with pytest.raises(msgspec.ValidationError):
+            LLMClient._parse_intent(completion(content))
+
+
+class TestCompact:
+    def test_drops_nulls_noise_fields_and_api_links(self):
+        data = {
+            "login": "a", "html_url": "https://github.com/a", "url": "https://api.github.com/users/a",
+            "avatar_url": "x", "followers_url": "y", "node_id": "n", "body": "long", "email": None,
+        }
+        assert _compact(data) == {"login": "a", "html_url": "https://github.com/a"}
+
+    def test_recurses_into_nested_structures(self):
+        data = {"items": [{"name": "r", "owner": {"login": "a", "node_id": "n"}}]}
+        assert _compact(data) == {"items": [{"name": "r", "owner": {"login": "a"}}]}
+
+    def test_truncates_long_lists_and_reports_total(self):
+        result = _compact(list(range(25)), max_items=20)
+        assert result[:20] == list(range(20))
+        assert result[20] == "... 5 more items omitted (total 25)"
+        assert len(result) == 21
+
+    def test_short_lists_and_scalars_are_unchanged(self):
+        assert _compact([1, 2, 3]) == [1, 2, 3]
+        assert _compact("text") == "text"
+
+
+class TestHTTPClient:
+    def test_shared_client_uses_an_httpx_timeout(self):
+        assert llm_client._HTTP_CLIENT.timeout == httpx.Timeout(600.0, connect=5.0)
+
+    def test_query_is_sent_through_the_shared_http_client(self, monkeypatch):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json={
+                "id": "c1", "object": "chat.completion", "created": 0, "model": "m",
+                "choices": [{
+                    "index": 0, "finish_reason": "stop",
+                    "message": {"role": "assistant", "content": '{"intent": "get_contributors", "parameters": {"owner": "o", "repo": "r"}}'},
+                }],
+            })
+
+        transport_client = httpx.Client(transport=httpx.MockTransport(handler), timeout=llm_client._HTTP_TIMEOUT)
+        monkeypatch.setattr(llm_client, "_HTTP_CLIENT", transport_client)
+        client = LLMClient(api_key="k", base_url="https://llm.test/v1", model="m")
+        assert client.process_query("who contributes to o/r?") == {
+            "intent": "get_contributors", "parameters": {"owner": "o", "repo": "r"}
+        }
+        assert [str(request.url) for request in requests] == ["https://llm.test/v1/chat/completions"]